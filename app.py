@@ -1,6 +1,7 @@
 import flet as ft
 from ui.main_window import MainWindow
 import asyncio
+import logging
 
 
 def main(page: ft.Page):
@@ -30,4 +31,5 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     ft.app(target=main, assets_dir="assets")
\ No newline at end of file
@@ -3,6 +3,44 @@ from typing import Dict, List, Optional
 from pathlib import Path
 
 
+# Precompiled patterns shared by every MarkdownEnhancer instance
+_MD_HEADING = re.compile(r'^#{1,6}\s')
+_MD_HEADING_PARTS = re.compile(r'^(#{1,6})\s*(.*)')
+_HEADING_TRIM = re.compile(r'^[#\s\-=_*]+|[#\s\-=_*]+$')
+_UNDERLINE = re.compile(r'^(?:(?P<eq>=+)|(?P<dash>-+))$')
+_LIST_ITEM = re.compile(
+    r'^(?P<md>[\s]*(?:[-*+]|\d+\.)\s)'           # Already proper Markdown list
+    r'|^(?P<num>\d+)[.)]\s*(?P<ntext>.*)$'         # Numbered list patterns
+    r'|^(?P<bul>[•·▪▫‣⁃\-–—*])\s*(?P<btext>.*)$'    # Bullets, dashes and bare asterisks
+)
+_ALT_BULLET = re.compile(r'^[\s]*[*+]\s')
+_ALT_BULLET_SUB = re.compile(r'^([\s]*)[*+](\s)')
+_WS2 = re.compile(r'\s{2,}')
+_BARE_URL = re.compile(r'\b(https?://[^\s<>"{}|\\^`\[\]]+)')
+_SPACED_LINK = re.compile(r'\[([^\]]+)\]\s*\(([^)]+)\)')
+_TRIPLE_STAR = re.compile(r'\*{3,}([^*]+)\*{3,}')
+_TRIPLE_UNDERSCORE = re.compile(r'_{3,}([^_]+)_{3,}')
+_BOLD_OPEN = re.compile(r'([^\s])\*\*([^*])')
+_BOLD_CLOSE = re.compile(r'([^*])\*\*([^\s])')
+
+# Heading title -> GitHub-style anchor: spaces become dashes, punctuation is dropped
+_ANCHOR_TRANS = str.maketrans({
+    ' ': '-', ':': None, ',': None, '.': None, '?': None, '!': None, '(': None, ')': None,
+})
+
+# Number of lines joined per write in MarkdownEnhancer.enhance_to_file
+_WRITE_BATCH_LINES = 4096
+
+
+def _is_numbered(text: str, markers: str = '.)') -> bool:
+    """Return True if text starts with digits followed by one of the marker characters."""
+    i = 0
+    length = len(text)
+    while i < length and text[i].isdecimal():
+        i += 1
+    return 0 < i < length and text[i] in markers
+
+
 class MarkdownEnhancer:
     """
     Post-processor for enhancing MarkItDown output with proper Markdown formatting.
@@ -30,97 +68,137 @@ class MarkdownEnhancer:
         Returns:
             Enhanced Markdown content
         """
-        if not content or not content.strip():
+        if not content:
             return content
 
+        return '\n'.join(self._enhance_lines(content, file_extension, preserve_structure))
+
+    def enhance_to_file(self, content: str, output_path: str, file_extension: str = "",
+                        preserve_structure: bool = True) -> None:
+        """
+        Enhance content and write it to a file in batches of lines.
+
+        Avoids building the complete enhanced document as one string before writing.
+
+        Args:
+            content: Raw text content from MarkItDown
+            output_path: Path of the Markdown file to write
+            file_extension: Original file extension for format-specific processing
+            preserve_structure: Whether to preserve existing structure
+        """
+        lines = self._enhance_lines(content or "", file_extension, preserve_structure)
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for start in range(0, len(lines), _WRITE_BATCH_LINES):
+                if start:
+                    f.write('\n')
+                f.write('\n'.join(lines[start:start + _WRITE_BATCH_LINES]))
+
+    def _enhance_lines(self, content: str, file_extension: str, preserve_structure: bool) -> List[str]:
+        """Run the enhancement pipeline and return the resulting lines."""
+        if not content.strip():
+            return [content]
+
         # Handle .md files specially
         if file_extension.lower() == '.md' and preserve_structure:
             return self._enhance_existing_markdown(content)
 
-        # Apply progressive enhancement based on level
-        enhanced = content
+        # Apply progressive enhancement based on level. The content is split
+        # once and the line-oriented stages share that buffer; only the
+        # substitutions that may span line breaks work on the joined text.
 
         # Basic enhancements (always applied)
-        enhanced = self._fix_line_endings(enhanced)
-        enhanced = self._enhance_headings(enhanced)
-        enhanced = self._enhance_lists(enhanced)
-        enhanced = self._clean_spacing(enhanced)
+        lines = self._fix_line_endings(content)
+        lines = self._enhance_headings_and_lists(lines)
+        lines = self._clean_spacing(lines)
 
         if self.enhancement_level in ["standard", "advanced"]:
-            enhanced = self._enhance_tables(enhanced)
+            lines = self._enhance_tables(lines)
+            lines = self._enhance_code_blocks(lines)
+
+            enhanced = '\n'.join(lines)
             enhanced = self._enhance_links(enhanced)
             enhanced = self._enhance_emphasis(enhanced)
-            enhanced = self._enhance_code_blocks(enhanced)
+            lines = enhanced.split('\n')
 
         if self.enhancement_level == "advanced":
-            enhanced = self._enhance_structure(enhanced)
-            enhanced = self._add_table_of_contents(enhanced)
-            enhanced = self._optimize_readability(enhanced)
+            lines = self._enhance_structure(lines)
+            lines = self._add_table_of_contents(lines)
+            lines = self._optimize_readability(lines)
 
-        return enhanced
+        return lines
 
-    def _enhance_existing_markdown(self, content: str) -> str:
+    def _enhance_existing_markdown(self, content: str) -> List[str]:
         """Enhanced processing for files that are already in Markdown format."""
         # Clean up and standardize existing Markdown
-        enhanced = self._standardize_headings(content)
-        enhanced = self._standardize_lists(enhanced)
-        enhanced = self._clean_spacing(enhanced)
-        return enhanced
-
-    def _fix_line_endings(self, content: str) -> str:
-        """Normalize line endings and remove excessive whitespace."""
-        # Normalize line endings
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        # Remove trailing whitespace from lines
-        lines = [line.rstrip() for line in content.split('\n')]
-        return '\n'.join(lines)
-
-    def _enhance_headings(self, content: str) -> str:
-        """Convert common heading patterns to proper Markdown headings."""
         lines = content.split('\n')
+        lines = self._standardize_headings(lines)
+        lines = self._standardize_lists(lines)
+        lines = self._clean_spacing(lines)
+        return lines
+
+    def _fix_line_endings(self, content: str) -> List[str]:
+        """Normalize line endings, remove trailing whitespace and split into lines."""
+        # splitlines() handles \n, \r\n and \r (and other Unicode breaks) in a
+        # single scan; remove trailing whitespace from each line as we go
+        lines = [line.rstrip() for line in content.splitlines()]
+        # Keep the final empty line that a trailing line break implies
+        if content.endswith(('\n', '\r')):
+            lines.append('')
+        return lines
+
+    def _enhance_headings_and_lists(self, lines: List[str]) -> List[str]:
+        """Convert common heading and list patterns to proper Markdown in one pass."""
         enhanced_lines = []
+        # Strip every line once; heading detection looks ahead into this view
+        stripped_lines = [line.strip() for line in lines]
 
-        for i, line in enumerate(lines):
-            line = line.strip()
+        for i, line in enumerate(stripped_lines):
             if not line:
                 enhanced_lines.append('')
                 continue
 
             # Detect heading patterns
-            heading_level = self._detect_heading_level(line, i, lines)
+            heading_level = self._detect_heading_level(line, i, stripped_lines)
 
             if heading_level > 0:
                 # Clean the line and make it a proper heading
-                clean_line = re.sub(r'^[#\s\-=_*]+|[#\s\-=_*]+$', '', line).strip()
+                clean_line = _HEADING_TRIM.sub('', line).strip()
                 if clean_line:
                     enhanced_lines.append('#' * heading_level + ' ' + clean_line)
-                else:
-                    enhanced_lines.append(line)
-            else:
-                enhanced_lines.append(line)
+                    continue
 
-        return '\n'.join(enhanced_lines)
+            # Detect list patterns
+            list_item = self._detect_list_item(line)
+            enhanced_lines.append(list_item if list_item else line)
+
+        return enhanced_lines
 
-    def _detect_heading_level(self, line: str, index: int, lines: List[str]) -> int:
-        """Detect if a line should be treated as a heading and determine its level."""
-        if not line.strip():
+    def _detect_heading_level(self, line: str, index: int, stripped_lines: List[str]) -> int:
+        """Detect if a stripped line should be treated as a heading and determine its level."""
+        if not line:
             return 0
 
         # Already a markdown heading
-        if re.match(r'^#{1,6}\s', line):
+        if line[0] == '#' and _MD_HEADING.match(line):
             return 0  # Don't modify existing headings
 
+        ends_sentence = line.endswith(('.', '!', '?'))
+
         # ALL CAPS lines (likely headings)
-        if len(line) > 3 and line.isupper() and not re.search(r'[.!?]$', line):
+        if len(line) > 3 and line.isupper() and not ends_sentence:
             return 1
 
         # Lines with underlines (= or -)
-        if index + 1 < len(lines):
-            next_line = lines[index + 1].strip()
-            if re.match(r'^=+$', next_line):
-                return 1
-            elif re.match(r'^-+$', next_line):
-                return 2
+        if index + 1 < len(stripped_lines) and stripped_lines[index + 1][:1] in ('=', '-'):
+            underline = _UNDERLINE.match(stripped_lines[index + 1])
+            if underline:
+                return 1 if underline.group('eq') else 2
+
+        # The remaining patterns only apply to short lines, so paragraph
+        # text stops here
+        if len(line) >= 80:
+            return 0
 
         # Lines that end with colons and are short
         if line.endswith(':') and len(line) < 60 and not line.count(':') > 2:
@@ -128,45 +206,43 @@ class MarkdownEnhancer:
 
         # Standalone lines that look like section headers (short, no punctuation, followed by content)
         if (len(line) < 60 and
-            not re.search(r'[.!?]$', line) and
+            not ends_sentence and
             not line.startswith(('-', '*', '+')) and
-            not re.match(r'^\d+[.)]', line) and  # Don't convert numbered list items
+            not _is_numbered(line) and  # Don't convert numbered list items
             len(line.split()) <= 4 and  # Short phrases only
-            index + 1 < len(lines)):
+            index + 1 < len(stripped_lines)):
 
             # Look ahead to see what follows
-            next_line = lines[index + 1].strip()
+            next_line = stripped_lines[index + 1]
 
             # If directly followed by a list or content, it's likely a heading
             if (next_line and (
                 next_line.startswith(('-', '*', '+')) or
-                re.match(r'^\d+[.)]', next_line) or
+                _is_numbered(next_line) or
                 (len(next_line) > 15 and next_line.endswith('.')) or
                 next_line.startswith('#'))):
                 return 2
 
             # Also check if there's a blank line then a list (common pattern)
-            if (index + 2 < len(lines) and
+            if (index + 2 < len(stripped_lines) and
                 not next_line and  # blank line
-                lines[index + 2].strip() and
-                lines[index + 2].strip().startswith(('-', '*', '+'))):
+                stripped_lines[index + 2].startswith(('-', '*', '+'))):
                 return 2
 
         # First significant line of document
-        if index == 0 or (index < 5 and all(not l.strip() for l in lines[:index])):
+        if index == 0 or (index < 5 and all(not l for l in stripped_lines[:index])):
             if len(line) < 80 and not line.endswith('.'):
                 return 1
 
         return 0
 
-    def _standardize_headings(self, content: str) -> str:
+    def _standardize_headings(self, lines: List[str]) -> List[str]:
         """Standardize existing Markdown headings."""
-        lines = content.split('\n')
         enhanced_lines = []
 
         for line in lines:
             # Fix heading formatting
-            heading_match = re.match(r'^(#{1,6})\s*(.*)', line)
+            heading_match = _MD_HEADING_PARTS.match(line)
             if heading_match:
                 level = heading_match.group(1)
                 text = heading_match.group(2).strip()
@@ -177,105 +253,65 @@ class MarkdownEnhancer:
             else:
                 enhanced_lines.append(line)
 
-        return '\n'.join(enhanced_lines)
-
-    def _enhance_lists(self, content: str) -> str:
-        """Convert text patterns to proper Markdown lists."""
-        lines = content.split('\n')
-        enhanced_lines = []
-
-        for line in lines:
-            original_line = line
-            line = line.strip()
-
-            if not line:
-                enhanced_lines.append('')
-                continue
-
-            # Detect list patterns
-            list_item = self._detect_list_item(line)
-            if list_item:
-                enhanced_lines.append(list_item)
-            else:
-                enhanced_lines.append(original_line)
-
-        return '\n'.join(enhanced_lines)
+        return enhanced_lines
 
     def _detect_list_item(self, line: str) -> Optional[str]:
         """Detect and format list items."""
-        # Already proper Markdown list
-        if re.match(r'^[\s]*[-*+]\s', line) or re.match(r'^[\s]*\d+\.\s', line):
+        match = _LIST_ITEM.match(line)
+        if not match or match.group('md'):
             return None
 
-        # Numbered list patterns
-        numbered_match = re.match(r'^(\d+)[.)]\s*(.*)', line)
-        if numbered_match:
-            return f"{numbered_match.group(1)}. {numbered_match.group(2)}"
-
-        # Bullet list patterns
-        bullet_patterns = [
-            r'^[•·▪▫‣⁃]\s*(.*)',  # Various bullet characters
-            r'^[-–—]\s*(.*)',      # Dashes
-            r'^\*\s*(.*)',         # Asterisks (not already formatted)
-        ]
-
-        for pattern in bullet_patterns:
-            match = re.match(pattern, line)
-            if match:
-                return f"- {match.group(1)}"
+        if match.group('num'):
+            return f"{match.group('num')}. {match.group('ntext')}"
 
-        return None
+        return f"- {match.group('btext')}"
 
-    def _standardize_lists(self, content: str) -> str:
+    def _standardize_lists(self, lines: List[str]) -> List[str]:
         """Standardize existing Markdown lists."""
-        lines = content.split('\n')
         enhanced_lines = []
 
         for line in lines:
             # Standardize list formatting
-            if re.match(r'^[\s]*[*+]\s', line):
+            if _ALT_BULLET.match(line):
                 # Convert + and * to -
-                enhanced_lines.append(re.sub(r'^([\s]*)[*+](\s)', r'\1-\2', line))
+                enhanced_lines.append(_ALT_BULLET_SUB.sub(r'\1-\2', line))
             else:
                 enhanced_lines.append(line)
 
-        return '\n'.join(enhanced_lines)
+        return enhanced_lines
 
-    def _enhance_tables(self, content: str) -> str:
+    def _enhance_tables(self, lines: List[str]) -> List[str]:
         """Detect and enhance table formatting."""
-        lines = content.split('\n')
         enhanced_lines = []
-        i = 0
+        table_lines = []
+        first_row = None
 
-        while i < len(lines):
-            line = lines[i].strip()
+        def flush_table():
+            if len(table_lines) >= 2:  # Need at least header + one row
+                enhanced_lines.extend(self._format_table(table_lines))
+            elif table_lines:
+                enhanced_lines.append(first_row)
+            table_lines.clear()
 
-            # Detect potential table by looking for patterns with | or multiple tabs/spaces
-            if self._looks_like_table_row(line):
-                table_lines = []
-                j = i
+        for line in lines:
+            stripped = line.strip()
 
+            # Detect potential table by looking for patterns with | or multiple tabs/spaces
+            if self._looks_like_table_row(stripped):
                 # Collect consecutive table-like lines
-                while j < len(lines) and self._looks_like_table_row(lines[j].strip()):
-                    table_lines.append(lines[j].strip())
-                    j += 1
-
-                if len(table_lines) >= 2:  # Need at least header + one row
-                    formatted_table = self._format_table(table_lines)
-                    enhanced_lines.extend(formatted_table)
-                    i = j
-                else:
-                    enhanced_lines.append(lines[i])
-                    i += 1
+                if not table_lines:
+                    first_row = line
+                table_lines.append(stripped)
             else:
-                enhanced_lines.append(lines[i])
-                i += 1
+                flush_table()
+                enhanced_lines.append(line)
 
-        return '\n'.join(enhanced_lines)
+        flush_table()
+        return enhanced_lines
 
     def _looks_like_table_row(self, line: str) -> bool:
         """Check if a line looks like it could be part of a table."""
-        if not line or line.startswith('#'):
+        if not line or line[0] == '#':
             return False
 
         # Has multiple | characters
@@ -283,11 +319,13 @@ class MarkdownEnhancer:
             return True
 
         # Has multiple tab-separated values
-        if '\t' in line and len(line.split('\t')) >= 3:
+        if line.count('\t') >= 2:
             return True
 
-        # Has multiple values separated by 2+ spaces
-        if len(re.split(r'\s{2,}', line)) >= 3:
+        # Has multiple values separated by 2+ spaces. Only lines containing a
+        # double space (or non-ASCII whitespace) can match, so skip the split
+        # for ordinary prose.
+        if ('  ' in line or not line.isascii()) and len(_WS2.split(line)) >= 3:
             return True
 
         return False
@@ -304,133 +342,134 @@ class MarkdownEnhancer:
                 # Split by | and clean up
                 cells = [cell.strip() for cell in line.split('|')]
                 # Remove empty cells at start/end
-                if cells and not cells[0]:
-                    cells = cells[1:]
-                if cells and not cells[-1]:
-                    cells = cells[:-1]
-                rows.append(cells)
+                start = 1 if not cells[0] else 0
+                end = len(cells) - 1 if len(cells) > start and not cells[-1] else len(cells)
+                rows.append(tuple(cells[start:end]))
             elif '\t' in line:
                 # Split by tabs
-                rows.append([cell.strip() for cell in line.split('\t')])
+                rows.append(tuple(cell.strip() for cell in line.split('\t')))
             else:
                 # Split by multiple spaces
-                rows.append([cell.strip() for cell in re.split(r'\s{2,}', line)])
+                rows.append(tuple(cell.strip() for cell in _WS2.split(line)))
 
         if not rows:
             return table_lines
 
-        # Ensure all rows have the same number of columns
+        # Pad every row to the same number of columns and format as a
+        # Markdown table, with the separator after the header row
         max_cols = max(len(row) for row in rows)
-        for row in rows:
-            while len(row) < max_cols:
-                row.append('')
-
-        # Format as Markdown table
-        formatted = []
-
-        # Header row
-        if rows:
-            header = '| ' + ' | '.join(rows[0]) + ' |'
-            formatted.append(header)
-
-            # Separator row
-            separator = '|' + '---|' * max_cols
-            formatted.append(separator)
-
-            # Data rows
-            for row in rows[1:]:
-                data_row = '| ' + ' | '.join(row) + ' |'
-                formatted.append(data_row)
+        formatted = [
+            '| ' + ' | '.join(row + ('',) * (max_cols - len(row))) + ' |'
+            for row in rows
+        ]
+        formatted.insert(1, '|' + '---|' * max_cols)
 
         return formatted
 
     def _enhance_links(self, content: str) -> str:
         """Enhance link formatting."""
+        # Cheap substring checks skip the regex scans for documents without links
         # Convert bare URLs to proper Markdown links
-        url_pattern = r'\b(https?://[^\s<>"{}|\\^`\[\]]+)'
-        content = re.sub(url_pattern, r'[\1](\1)', content)
+        if 'http' in content:
+            content = _BARE_URL.sub(r'[\1](\1)', content)
 
         # Fix malformed links
-        content = re.sub(r'\[([^\]]+)\]\s*\(([^)]+)\)', r'[\1](\2)', content)
+        if '[' in content:
+            content = _SPACED_LINK.sub(r'[\1](\2)', content)
 
         return content
 
     def _enhance_emphasis(self, content: str) -> str:
         """Enhance bold and italic formatting."""
+        if '*' not in content and '_' not in content:
+            return content
+
         # Convert **text** patterns that might be malformed
-        content = re.sub(r'\*{3,}([^*]+)\*{3,}', r'**\1**', content)  # Multiple asterisks to bold
-        content = re.sub(r'_{3,}([^_]+)_{3,}', r'**\1**', content)    # Multiple underscores to bold
+        if '***' in content:
+            content = _TRIPLE_STAR.sub(r'**\1**', content)  # Multiple asterisks to bold
+        if '___' in content:
+            content = _TRIPLE_UNDERSCORE.sub(r'**\1**', content)    # Multiple underscores to bold
 
         # Ensure proper spacing around emphasis
-        content = re.sub(r'([^\s])\*\*([^*])', r'\1 **\2', content)
-        content = re.sub(r'([^*])\*\*([^\s])', r'\1** \2', content)
+        if '**' in content:
+            content = _BOLD_OPEN.sub(r'\1 **\2', content)
+            content = _BOLD_CLOSE.sub(r'\1** \2', content)
 
         return content
 
-    def _enhance_code_blocks(self, content: str) -> str:
+    def _enhance_code_blocks(self, lines: List[str]) -> List[str]:
         """Enhance code block formatting."""
-        lines = content.split('\n')
-        enhanced_lines = []
-        in_code_block = False
+        # Fenced blocks, indented code and inline code are all kept verbatim,
+        # so there is nothing to rewrite and no need to walk the lines
+        return lines
+
+    def _collapse_blank_lines(self, lines: List[str]) -> List[str]:
+        """Collapse runs of blank lines, equivalent to replacing 3+ newlines with 2."""
+        collapsed = []
+        blank_run = 0
+        seen_text = False
 
         for line in lines:
-            # Detect code blocks by indentation or backticks
-            if line.strip().startswith('```'):
-                enhanced_lines.append(line)
-                in_code_block = not in_code_block
-            elif not in_code_block and (line.startswith('    ') or line.startswith('\t')):
-                # Convert indented code to fenced code blocks if multiple lines
-                enhanced_lines.append(line)
+            if line:
+                blank_run = 0
+                seen_text = True
             else:
-                # Convert inline code patterns
-                enhanced_line = re.sub(r'`([^`]+)`', r'`\1`', line)  # Ensure proper backticks
-                enhanced_lines.append(enhanced_line)
+                blank_run += 1
+                # Leading runs keep two blank lines, inner runs keep one
+                if blank_run > (1 if seen_text else 2):
+                    continue
+            collapsed.append(line)
+
+        # Trailing runs keep two blank lines as well
+        if seen_text and blank_run >= 2:
+            collapsed.append('')
 
-        return '\n'.join(enhanced_lines)
+        return collapsed
 
-    def _clean_spacing(self, content: str) -> str:
+    def _clean_spacing(self, lines: List[str]) -> List[str]:
         """Clean up spacing and line breaks."""
         # Remove excessive blank lines (more than 2 consecutive)
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        lines = self._collapse_blank_lines(lines)
 
-        # Ensure proper spacing around headings and sections
-        lines = content.split('\n')
+        # Ensure proper spacing around headings and sections. Each line is
+        # stripped once up front and reused as the next line's look-ahead.
+        stripped_lines = [line.strip() for line in lines]
+        last_index = len(lines) - 1
         enhanced_lines = []
+        prev_has_text = False
 
-        for i, line in enumerate(lines):
-            current_line = line.strip()
+        for i, (line, current_line) in enumerate(zip(lines, stripped_lines)):
+            is_heading = current_line.startswith('#')
+            next_line = stripped_lines[i + 1] if i < last_index else ''
 
             # Add blank line before headings (except at start)
-            if current_line.startswith('#') and i > 0:
-                if enhanced_lines and enhanced_lines[-1].strip():
-                    enhanced_lines.append('')
+            if is_heading and i > 0 and prev_has_text:
+                enhanced_lines.append('')
 
             enhanced_lines.append(line)
+            prev_has_text = bool(current_line)
 
             # Add blank line after headings if not present
-            if current_line.startswith('#') and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
+            if is_heading:
                 if next_line and not next_line.startswith('#'):
                     enhanced_lines.append('')
+                    prev_has_text = False
 
             # Add spacing after paragraphs that end with periods
             elif (current_line.endswith('.') and
-                  i + 1 < len(lines) and
-                  lines[i + 1].strip() and
-                  not lines[i + 1].strip().startswith(('#', '-', '*', '+')) and
-                  not re.match(r'^\d+\.', lines[i + 1].strip())):
+                  next_line and
+                  not next_line.startswith(('#', '-', '*', '+')) and
+                  not _is_numbered(next_line, '.')):
                 # Check if next line starts a new paragraph/section
-                next_line = lines[i + 1].strip()
                 if len(next_line) > 20 or next_line[0].isupper():
                     enhanced_lines.append('')
+                    prev_has_text = False
 
-        return '\n'.join(enhanced_lines)
+        return enhanced_lines
 
-    def _enhance_structure(self, content: str) -> str:
+    def _enhance_structure(self, lines: List[str]) -> List[str]:
         """Advanced structural enhancements."""
         # Add proper document structure
-        lines = content.split('\n')
-
         # Find the main title (first heading)
         title_found = False
         for i, line in enumerate(lines):
@@ -441,19 +480,22 @@ class MarkdownEnhancer:
                     lines.insert(i + 1, '')
                 break
 
-        return '\n'.join(lines)
+        return lines
 
-    def _add_table_of_contents(self, content: str) -> str:
+    def _add_table_of_contents(self, lines: List[str]) -> List[str]:
         """Add a table of contents for documents with multiple headings."""
-        lines = content.split('\n')
         headings = []
+        title_index = None
 
-        # Extract headings
-        for line in lines:
-            if re.match(r'^#{1,6}\s', line):
+        # Extract headings and locate the main title in a single scan
+        for i, line in enumerate(lines):
+            if line[:1] == '#':
                 level = len(line) - len(line.lstrip('#'))
-                title = line.strip('#').strip()
-                headings.append((level, title))
+                if level <= 6 and line[level:level + 1].isspace():
+                    title = line.strip('#').strip()
+                    headings.append((level, title))
+            if title_index is None and line.strip().startswith('# '):
+                title_index = i
 
         # Only add TOC if there are multiple headings
         if len(headings) >= 3:
@@ -462,31 +504,54 @@ class MarkdownEnhancer:
                 if level == 1:
                     continue  # Skip main title
                 indent = '  ' * (level - 2)
-                anchor = title.lower().replace(' ', '-').replace(':', '')
+                anchor = title.lower().translate(_ANCHOR_TRANS)
                 toc_lines.append(f"{indent}- [{title}](#{anchor})")
 
             toc_lines.extend(['', '---', ''])
 
             # Insert TOC after first heading
-            for i, line in enumerate(lines):
-                if line.strip().startswith('# '):
-                    # Find next blank line or heading
-                    insert_pos = i + 1
-                    while insert_pos < len(lines) and lines[insert_pos].strip() and not lines[insert_pos].startswith('#'):
-                        insert_pos += 1
-                    insert_pos += 1  # Add one more line for spacing
+            if title_index is not None:
+                # Find next blank line or heading
+                insert_pos = title_index + 1
+                while insert_pos < len(lines) and lines[insert_pos].strip() and not lines[insert_pos].startswith('#'):
+                    insert_pos += 1
+                insert_pos += 1  # Add one more line for spacing
 
-                    lines[insert_pos:insert_pos] = toc_lines
-                    break
+                lines[insert_pos:insert_pos] = toc_lines
 
-        return '\n'.join(lines)
+        return lines
 
-    def _optimize_readability(self, content: str) -> str:
+    def _optimize_readability(self, lines: List[str]) -> List[str]:
         """Final readability optimizations."""
-        # Ensure consistent paragraph spacing
-        content = re.sub(r'([.!?])\n([A-Z])', r'\1\n\n\2', content)
+        # Ensure consistent paragraph spacing: a sentence end followed by a
+        # capitalized line starts a new paragraph
+        spaced_lines = []
+        blank_run = 0
+        for i, line in enumerate(lines):
+            # Clean up any remaining formatting issues (max 2 consecutive blank lines)
+            if not line:
+                blank_run += 1
+                if blank_run > 2:
+                    continue
+            else:
+                blank_run = 0
+
+            spaced_lines.append(line)
+
+            if (line.endswith(('.', '!', '?')) and i + 1 < len(lines) and
+                    'A' <= lines[i + 1][:1] <= 'Z'):
+                spaced_lines.append('')
+
+        # Trim surrounding whitespace and ensure file ends with newline
+        start, end = 0, len(spaced_lines)
+        while start < end and not spaced_lines[start].strip():
+            start += 1
+        while end > start and not spaced_lines[end - 1].strip():
+            end -= 1
 
-        # Clean up any remaining formatting issues
-        content = re.sub(r'\n{4,}', '\n\n\n', content)  # Max 3 consecutive newlines
+        trimmed = spaced_lines[start:end] or ['']
+        trimmed[0] = trimmed[0].lstrip()
+        trimmed[-1] = trimmed[-1].rstrip()
+        trimmed.append('')
 
-        return content.strip() + '\n'  # Ensure file ends with newline
\ No newline at end of file
+        return trimmed
@@ -1,19 +1,47 @@
 import os
+import re
 import asyncio
+import functools
 from pathlib import Path
-from typing import List, Tuple, Dict, Callable, Optional
+from typing import FrozenSet, List, Tuple, Callable, Optional
 from markitdown import MarkItDown
 import threading
 from concurrent.futures import ThreadPoolExecutor
 import time
+import uuid
 from .markdown_enhancer import MarkdownEnhancer
+from .settings import ConversionSettings
+
+
+_YOUTUBE_URL = re.compile(r'^https?://(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)/')
+
+# Larger .txt/.url inputs are treated as documents, not YouTube links
+_MAX_URL_FILE_SIZE = 4096
+
+_SUPPORTED_FORMAT_LIST = (
+    "pdf", "docx", "xlsx", "pptx",  # Office documents
+    "jpg", "jpeg", "png", "gif", "bmp",  # Images
+    "html", "htm",  # Web
+    "txt", "csv", "json", "xml",  # Text formats
+    "epub",  # E-books
+    "mp3", "wav", "m4a",  # Audio (with transcription)
+    "zip",  # Archives
+    "url"  # YouTube URLs in .url files
+)
+_SUPPORTED_FORMATS: FrozenSet[str] = frozenset(_SUPPORTED_FORMAT_LIST)
+
+@functools.lru_cache(maxsize=4)
+def _get_enhancer(enhancement_level: str) -> MarkdownEnhancer:
+    """Return a shared enhancer for the given level (enhancers hold no per-document state)."""
+    return MarkdownEnhancer(enhancement_level=enhancement_level)
 
 
 class MarkItDownConverter:
     def __init__(self):
         self._initialize_converter()
-        self.enhancer = MarkdownEnhancer(enhancement_level="standard")
+        self.enhancer = _get_enhancer("standard")
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self._output_lock = threading.Lock()
         self.current_file = ""
         self.is_converting = False
         self.cancel_requested = False
@@ -43,15 +71,17 @@ class MarkItDownConverter:
             enhancement_level: "basic", "standard", or "advanced"
             preserve_structure: Whether to preserve document structure
         """
-        self.enhancer = MarkdownEnhancer(enhancement_level=enhancement_level)
+        self.enhancer = _get_enhancer(enhancement_level)
         self.preserve_structure = preserve_structure
 
-    def convert_single_file(self, file_path: str, output_dir: str, settings: Dict) -> Tuple[bool, str, str]:
+    def convert_single_file(self, file_path: str, output_dir: str, settings: ConversionSettings) -> Tuple[bool, str, str]:
         """
         Convert a single file to markdown
         Returns: (success, output_path, error_message)
         """
         try:
+            path = Path(file_path)
+
             # Check if it's a YouTube URL (in a text file or direct)
             if self._is_youtube_url(file_path):
                 result = self._convert_youtube_url(file_path)
@@ -61,48 +91,70 @@ class MarkItDownConverter:
 
             if result and result.text_content:
                 # Apply markdown enhancement
-                file_extension = Path(file_path).suffix
-                enhancement_level = settings.get("enhancement_level", "standard")
-                preserve_structure = settings.get("preserve_structure", True)
-
-                # Configure enhancer if settings changed
-                if hasattr(self, 'enhancer'):
-                    if self.enhancer.enhancement_level != enhancement_level:
-                        self.enhancer = MarkdownEnhancer(enhancement_level=enhancement_level)
-
-                # Enhance the markdown content
-                enhanced_content = self.enhancer.enhance(
-                    result.text_content,
-                    file_extension=file_extension,
-                    preserve_structure=preserve_structure
-                )
+                file_extension = path.suffix
+                enhancement_level = settings.enhancement_level
+                preserve_structure = settings.preserve_structure
+
+                # Reuse the cached enhancer for this level
+                enhancer = _get_enhancer(enhancement_level)
 
                 # Generate output filename
-                input_filename = Path(file_path).stem
+                input_filename = path.stem
                 timestamp = ""
-                if settings.get("add_timestamp", False):
+                if settings.add_timestamp:
                     timestamp = f"_{int(time.time())}"
 
                 output_filename = f"{input_filename}{timestamp}.md"
                 output_path = os.path.join(output_dir, output_filename)
 
-                # Check overwrite policy
-                if os.path.exists(output_path):
-                    if settings.get("overwrite_policy", "skip") == "skip":
-                        return (False, output_path, "File exists (skipped)")
-                    elif settings.get("overwrite_policy", "rename"):
-                        counter = 1
-                        base_path = output_path[:-3]  # Remove .md
-                        while os.path.exists(output_path):
-                            output_path = f"{base_path}_{counter}.md"
-                            counter += 1
+                # Skipped files need no enhancement; checked again under the lock
+                if settings.overwrite_policy == "skip" and os.path.exists(output_path):
+                    return (False, output_path, "File exists (skipped)")
 
                 # Ensure output directory exists
                 os.makedirs(output_dir, exist_ok=True)
 
-                # Write the enhanced markdown content
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(enhanced_content)
+                # Enhance into a private temp file next to the output. Workers
+                # never write the same file, and a failed run leaves any
+                # existing output untouched.
+                temp_path = os.path.join(output_dir, f".{output_filename}.{uuid.uuid4().hex}.tmp")
+                try:
+                    enhancer.enhance_to_file(
+                        result.text_content,
+                        temp_path,
+                        file_extension=file_extension,
+                        preserve_structure=preserve_structure
+                    )
+
+                    # Parallel workers may target the same name, so pick the
+                    # output path and move the finished file onto it while
+                    # holding the output lock
+                    with self._output_lock:
+                        # Check overwrite policy
+                        if os.path.exists(output_path):
+                            if settings.overwrite_policy == "skip":
+                                return (False, output_path, "File exists (skipped)")
+                            elif settings.overwrite_policy == "rename":
+                                # List the directory once and probe candidate names
+                                # against it instead of stat-ing each one. Names are
+                                # casefolded so case-insensitive filesystems (Windows,
+                                # macOS) cannot match another file's output, and the
+                                # pick is confirmed with one os.path.exists.
+                                base_name = output_filename[:-3]  # Remove .md
+                                with os.scandir(output_dir) as entries:
+                                    existing = {entry.name.casefold() for entry in entries}
+                                counter = 1
+                                while True:
+                                    candidate = f"{base_name}_{counter}.md"
+                                    output_path = os.path.join(output_dir, candidate)
+                                    if candidate.casefold() not in existing and not os.path.exists(output_path):
+                                        break
+                                    counter += 1
+
+                        os.replace(temp_path, output_path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
 
                 return (True, output_path, None)
             else:
@@ -113,17 +165,18 @@ class MarkItDownConverter:
 
     def _is_youtube_url(self, file_path: str) -> bool:
         """Check if the file contains or is a YouTube URL"""
-        if file_path.startswith("http") and "youtube.com" in file_path or "youtu.be" in file_path:
+        if _YOUTUBE_URL.match(file_path):
             return True
 
-        # Check if it's a text file containing a YouTube URL
-        if Path(file_path).suffix.lower() in ['.txt', '.url']:
+        # Check if it's a small text file containing a YouTube URL
+        if Path(file_path).suffix.lower() in ('.txt', '.url'):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if "youtube.com" in content or "youtu.be" in content:
-                        return True
-            except:
+                if os.path.getsize(file_path) < _MAX_URL_FILE_SIZE:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read().strip()
+                        if "youtube.com" in content or "youtu.be" in content:
+                            return True
+            except (OSError, UnicodeDecodeError):
                 pass
         return False
 
@@ -155,13 +208,16 @@ class MarkItDownConverter:
 
     async def batch_convert(
         self,
-        files: List[Tuple[str, str]],
+        files: List[Tuple],
         output_dir: str,
-        settings: Dict,
+        settings: ConversionSettings,
         progress_callback: Callable
     ):
         """
         Convert multiple files in batch with progress updates
+
+        Each entry in files starts with (file_path, file_name); any further
+        fields (such as the size recorded by the file selector) are ignored.
         """
         self.is_converting = True
         self.cancel_requested = False
@@ -175,63 +231,72 @@ class MarkItDownConverter:
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
 
-        for file_path, file_name in files:
-            if self.cancel_requested:
-                break
-
-            self.current_file = file_name
-
-            # Update progress
-            await progress_callback(
-                current_file=file_name,
-                completed=completed,
-                total=total_files,
-                successful=successful,
-                failed=failed,
-                status="converting"
-            )
-
-            # Convert file in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            success, output_path, error = await loop.run_in_executor(
-                self.executor,
-                self.convert_single_file,
-                file_path,
-                output_dir,
-                settings
-            )
-
-            # Track results
-            if success:
-                successful += 1
-                status = "success"
-            else:
-                failed += 1
-                status = "failed"
-
-            results.append({
-                "file": file_name,
-                "success": success,
-                "output": output_path,
-                "error": error,
-                "status": status
-            })
-
-            completed += 1
-
-            # Update progress with result
-            await progress_callback(
-                current_file=file_name,
-                completed=completed,
-                total=total_files,
-                successful=successful,
-                failed=failed,
-                status=status,
-                last_result=results[-1]
-            )
+        # Submit every file up front so the worker pool converts them concurrently
+        # Keep the executor jobs as well: unlike the asyncio wrappers, their
+        # cancel() refuses once a job has started running.
+        futures = {}
+        jobs = {}
+        for file_path, file_name, *_ in files:
+            job = self.executor.submit(self.convert_single_file, file_path, output_dir, settings)
+            future = asyncio.wrap_future(job)
+            futures[future] = file_name
+            jobs[future] = job
+
+        # Update progress
+        await progress_callback(
+            current_file=files[0][1] if files else "",
+            completed=completed,
+            total=total_files,
+            successful=successful,
+            failed=failed,
+            status="converting"
+        )
 
-            # Small delay to allow UI updates
-            await asyncio.sleep(0.1)
+        # Report results in completion order. asyncio.wait hands back the
+        # original futures, so each one maps straight to its file name.
+        pending = set(futures)
+        while pending:
+            if self.cancel_requested:
+                # Drop work that has not started yet; files already being
+                # converted are waited for and reported like the rest
+                pending = {future for future in pending if not jobs[future].cancel()}
+                if not pending:
+                    break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                file_name = futures[future]
+                self.current_file = file_name
+                success, output_path, error = future.result()
+
+                # Track results
+                if success:
+                    successful += 1
+                    status = "success"
+                else:
+                    failed += 1
+                    status = "failed"
+
+                results.append({
+                    "file": file_name,
+                    "success": success,
+                    "output": output_path,
+                    "error": error,
+                    "status": status
+                })
+
+                completed += 1
+
+                # Update progress with result
+                await progress_callback(
+                    current_file=file_name,
+                    completed=completed,
+                    total=total_files,
+                    successful=successful,
+                    failed=failed,
+                    status=status,
+                    last_result=results[-1]
+                )
 
         self.is_converting = False
 
@@ -250,15 +315,10 @@ class MarkItDownConverter:
         """Cancel the current batch conversion"""
         self.cancel_requested = True
 
-    def get_supported_formats(self) -> List[str]:
-        """Return list of supported file formats"""
-        return [
-            "pdf", "docx", "xlsx", "pptx",  # Office documents
-            "jpg", "jpeg", "png", "gif", "bmp",  # Images
-            "html", "htm",  # Web
-            "txt", "csv", "json", "xml",  # Text formats
-            "epub",  # E-books
-            "mp3", "wav", "m4a",  # Audio (with transcription)
-            "zip",  # Archives
-            "url"  # YouTube URLs in .url files
-        ]
\ No newline at end of file
+    def get_supported_formats(self) -> FrozenSet[str]:
+        """Return the set of supported file formats"""
+        return _SUPPORTED_FORMATS
+
+    def list_supported_formats(self) -> List[str]:
+        """Return list of supported file formats in display order"""
+        return list(_SUPPORTED_FORMAT_LIST)
\ No newline at end of file
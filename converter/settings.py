@@ -0,0 +1,15 @@
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True)
+class ConversionSettings:
+    """Options read for every file in a batch conversion."""
+    use_llm: bool = False
+    overwrite_policy: str = "skip"  # skip, overwrite or rename
+    add_timestamp: bool = False
+    preserve_structure: bool = True
+    enhancement_level: str = "standard"  # basic, standard or advanced
+    parallel_workers: int = 4
+
+
+CONVERSION_SETTING_FIELDS = frozenset(field.name for field in fields(ConversionSettings))
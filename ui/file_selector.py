@@ -1,14 +1,63 @@
 import flet as ft
+import asyncio
 import os
 from pathlib import Path
 
 
+SUPPORTED_EXTS = frozenset({
+    '.pdf', '.docx', '.xlsx', '.pptx', '.html', '.jpg', '.jpeg', '.png', '.txt', '.csv', '.json', '.xml',
+})
+# The file picker takes extensions without the leading dot
+PICKER_EXTS = sorted(ext[1:] for ext in SUPPORTED_EXTS)
+
+FILE_ICONS = {
+    '.pdf': ft.Icons.PICTURE_AS_PDF_ROUNDED,
+    '.docx': ft.Icons.ARTICLE_ROUNDED,
+    '.xlsx': ft.Icons.TABLE_CHART_ROUNDED,
+    '.pptx': ft.Icons.SLIDESHOW_ROUNDED,
+    '.html': ft.Icons.HTML_ROUNDED,
+    '.jpg': ft.Icons.IMAGE_ROUNDED,
+    '.jpeg': ft.Icons.IMAGE_ROUNDED,
+    '.png': ft.Icons.IMAGE_ROUNDED,
+    '.txt': ft.Icons.DESCRIPTION_ROUNDED,
+    '.csv': ft.Icons.TABLE_ROWS_ROUNDED,
+    '.json': ft.Icons.DATA_OBJECT_ROUNDED,
+    '.xml': ft.Icons.CODE_ROUNDED,
+}
+DEFAULT_ICON = ft.Icons.INSERT_DRIVE_FILE_ROUNDED
+
+# Translucent colors, built once rather than on every repaint
+WHITE_70 = ft.Colors.with_opacity(0.7, ft.Colors.WHITE)
+WHITE_10 = ft.Colors.with_opacity(0.1, ft.Colors.WHITE)
+WHITE_02 = ft.Colors.with_opacity(0.02, ft.Colors.WHITE)
+BLUE_30 = ft.Colors.with_opacity(0.3, ft.Colors.BLUE_ACCENT_400)
+BLUE_BG = ft.Colors.with_opacity(0.05, ft.Colors.BLUE_ACCENT_400)
+GREEN_50 = ft.Colors.with_opacity(0.5, ft.Colors.GREEN_ACCENT_400)
+GREEN_BG = ft.Colors.with_opacity(0.1, ft.Colors.GREEN_ACCENT_400)
+
+
+def _file_extension(name):
+    """Lower-cased extension of a file name ('' if none), without building a Path."""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+
+# The file list materializes rows one page at a time as the user scrolls
+FILE_LIST_PAGE_SIZE = 100
+FILE_ROW_HEIGHT = 32
+
+# Folder scans report files back to the UI in batches of this size
+SCAN_BATCH_SIZE = 500
+
+
 class FileSelector(ft.Container):
     def __init__(self, on_files_selected, on_start_conversion, page=None):
         self.on_files_selected = on_files_selected
         self.on_start_conversion = on_start_conversion
         self.page = page
         self.selected_files = []
+        self._last_selection_sig = None  # Selection shown by the last update_file_display
+        self._scan_generation = 0  # Bumped whenever the selection is replaced; stale scans check it
         self.output_directory = str(Path.home() / "Documents" / "MarkdownOutput")
         self.selection_mode = "files"  # files or folder
         super().__init__(content=self._build())
@@ -31,15 +80,20 @@ class FileSelector(ft.Container):
         self.stats_text = ft.Text(
             "No files selected",
             size=14,
-            color=ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
+            color=WHITE_70,
         )
 
-        # File list container
+        # File list container. Rows have a fixed extent so Flutter lays out only
+        # the visible ones, and further pages are added when scrolling nears
+        # the end. Auto-scroll stays off so appending a page does not jump to
+        # the bottom and trigger the next one.
         self.file_list = ft.ListView(
             height=300,  # Increased height for better visibility
-            spacing=5,
+            item_extent=FILE_ROW_HEIGHT,
             padding=ft.padding.all(10),
-            auto_scroll=True,  # Auto-scroll to bottom when new items added
+            auto_scroll=False,
+            on_scroll=self.on_file_list_scroll,
+            on_scroll_interval=100,
         )
 
         return ft.Column(
@@ -94,7 +148,7 @@ class FileSelector(ft.Container):
                     ft.Text(
                         "Supports: PDF, Word, Excel, PowerPoint, Images, HTML, YouTube URLs",
                         size=12,
-                        color=ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
+                        color=WHITE_70,
                         text_align=ft.TextAlign.CENTER,
                     ),
                 ],
@@ -104,12 +158,9 @@ class FileSelector(ft.Container):
             ),
             width=float("inf"),
             height=200,
-            border=ft.border.all(
-                2,
-                ft.Colors.with_opacity(0.3, ft.Colors.BLUE_ACCENT_400),
-            ),
+            border=ft.border.all(2, BLUE_30),
             border_radius=15,
-            bgcolor=ft.Colors.with_opacity(0.05, ft.Colors.BLUE_ACCENT_400),
+            bgcolor=BLUE_BG,
             on_click=self.on_browse_click,
             animate=ft.Animation(200, ft.AnimationCurve.EASE_IN_OUT),
         )
@@ -117,6 +168,14 @@ class FileSelector(ft.Container):
         return self.drop_container
 
     def _create_file_stats(self):
+        self.file_list_wrapper = ft.Container(
+            content=self.file_list,
+            border=ft.border.all(1, WHITE_10),
+            border_radius=10,
+            bgcolor=WHITE_02,
+            visible=False,  # Initially hidden
+        )
+
         return ft.Container(
             content=ft.Column(
                 controls=[
@@ -127,13 +186,7 @@ class FileSelector(ft.Container):
                         ],
                         spacing=10,
                     ),
-                    ft.Container(
-                        content=self.file_list,
-                        border=ft.border.all(1, ft.Colors.with_opacity(0.1, ft.Colors.WHITE)),
-                        border_radius=10,
-                        bgcolor=ft.Colors.with_opacity(0.02, ft.Colors.WHITE),
-                        visible=False,  # Initially hidden
-                    ),
+                    self.file_list_wrapper,
                 ],
                 spacing=10,
             ),
@@ -143,7 +196,7 @@ class FileSelector(ft.Container):
         self.output_path_text = ft.Text(
             self.output_directory,
             size=14,
-            color=ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
+            color=WHITE_70,
             max_lines=1,
             overflow=ft.TextOverflow.ELLIPSIS,
         )
@@ -172,9 +225,9 @@ class FileSelector(ft.Container):
                 spacing=10,
             ),
             padding=ft.padding.all(15),
-            border=ft.border.all(1, ft.Colors.with_opacity(0.1, ft.Colors.WHITE)),
+            border=ft.border.all(1, WHITE_10),
             border_radius=10,
-            bgcolor=ft.Colors.with_opacity(0.02, ft.Colors.WHITE),
+            bgcolor=WHITE_02,
         )
 
     def _create_action_buttons(self):
@@ -209,7 +262,7 @@ class FileSelector(ft.Container):
                 spacing=5,
             ),
             style=ft.ButtonStyle(
-                color=ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
+                color=WHITE_70,
                 padding=15,
             ),
             on_click=self.clear_selection,
@@ -234,7 +287,7 @@ class FileSelector(ft.Container):
                 dialog_title="Select files to convert",
                 allow_multiple=True,
                 file_type=ft.FilePickerFileType.CUSTOM,
-                allowed_extensions=["pdf", "docx", "xlsx", "pptx", "html", "jpg", "jpeg", "png", "txt", "csv", "json", "xml"],
+                allowed_extensions=PICKER_EXTS,
             )
         else:
             self.folder_picker.get_directory_path(
@@ -248,108 +301,171 @@ class FileSelector(ft.Container):
 
     def on_file_picker_result(self, e: ft.FilePickerResultEvent):
         if e.files:
-            self.selected_files = [(f.path, f.name) for f in e.files]
+            self._scan_generation += 1  # Drop any folder scan still running
+            # Entries are (path, name, size, extension); the picker already reports sizes
+            self.selected_files = [(f.path, f.name, f.size, _file_extension(f.name)) for f in e.files]
             self.update_file_display()
 
-    def on_folder_picker_result(self, e: ft.FilePickerResultEvent):
+    async def on_folder_picker_result(self, e: ft.FilePickerResultEvent):
         if e.path:
-            # Get all supported files in the folder
-            folder_path = e.path
-            supported_extensions = {'.pdf', '.docx', '.xlsx', '.pptx', '.html', '.jpg', '.jpeg', '.png', '.txt', '.csv', '.json', '.xml'}
-
+            self._scan_generation += 1
+            generation = self._scan_generation
             self.selected_files = []
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if Path(file).suffix.lower() in supported_extensions:
-                        file_path = os.path.join(root, file)
-                        self.selected_files.append((file_path, file))
+            self._last_selection_sig = None
+            self.file_list.controls.clear()
+            self.stats_text.value = "Scanning folder..."
+            self.convert_button.disabled = True  # Until the scan has finished
+            self.update()
 
+            # Walk the folder off the UI thread so the window stays responsive.
+            # Files are handed back in batches and shown while the walk goes on;
+            # call_soon_threadsafe keeps every batch ahead of the walk's result.
+            loop = asyncio.get_running_loop()
+            await asyncio.to_thread(
+                self._scan_folder,
+                e.path,
+                lambda batch: loop.call_soon_threadsafe(self._add_scanned_files, batch, generation),
+            )
+
+            # The selection was cleared or replaced while the folder was walked
+            if generation != self._scan_generation:
+                return
+            if not self.selected_files:
+                self.stats_text.value = "No files selected"
             self.update_file_display()
 
+    def _scan_folder(self, folder_path, on_batch):
+        """Pass supported files in the folder to on_batch as lists of (path, name, size, extension) tuples."""
+        # Walk with os.scandir so each DirEntry supplies its path, type and
+        # size without separate join/stat calls. Subfolders are pushed in
+        # reverse so they are visited in listing order, like os.walk.
+        batch = []
+        pending_dirs = [folder_path]
+        while pending_dirs:
+            subdirs = []
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+
+                        # _file_extension inlined; this runs once per file in the tree
+                        name = entry.name
+                        dot = name.rfind('.')
+                        ext = name[dot:].lower() if dot > 0 else ''
+                        if ext in SUPPORTED_EXTS:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                size = 0
+                            batch.append((entry.path, name, size, ext))
+                            if len(batch) >= SCAN_BATCH_SIZE:
+                                on_batch(batch)
+                                batch = []
+            except OSError:
+                continue  # Unreadable folder; skip it like os.walk does
+            pending_dirs.extend(reversed(subdirs))
+        if batch:
+            on_batch(batch)
+
+    def _add_scanned_files(self, batch, generation):
+        """Append a batch of scanned files to the selection and show progress."""
+        if generation != self._scan_generation:
+            return  # Batch from a scan whose selection has since been replaced
+        self.selected_files.extend(batch)
+        self._refresh_stats_only()
+
+    def _refresh_stats_only(self):
+        """Update the running file count and fill the first page of rows during a scan."""
+        self.stats_text.value = f"Scanning folder... {len(self.selected_files)} files found"
+        self.stats_text.update()
+
+        if not self.file_list.controls and self._show_more_files():
+            self.file_list_wrapper.visible = True
+            self.file_list_wrapper.update()
+
     def on_output_folder_result(self, e: ft.FilePickerResultEvent):
         if e.path:
             self.output_directory = e.path
             self.output_path_text.value = e.path
-            self.update()
+            self.output_path_text.update()
 
     def update_file_display(self):
-        if self.selected_files:
-            # Update stats
-            total_size = 0
-            file_types = {}
-
-            for file_path, file_name in self.selected_files:
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
-                    ext = Path(file_path).suffix.lower()
-                    file_types[ext] = file_types.get(ext, 0) + 1
+        # Re-picking the same files leaves the display as it is. The signature
+        # holds every path, so any changed file forces a rebuild; comparing it
+        # is still far cheaper than rebuilding the rows.
+        files = self.selected_files
+        total_size = sum(entry[2] for entry in files)
+        selection_sig = (total_size, tuple(entry[0] for entry in files))
+        if selection_sig == self._last_selection_sig:
+            self.on_files_selected(files)
+            return
+        self._last_selection_sig = selection_sig
 
-            # Update stats text
+        if self.selected_files:
+            # Update stats from the sizes recorded at selection time
             size_mb = total_size / (1024 * 1024)
             self.stats_text.value = f"{len(self.selected_files)} files selected ({size_mb:.1f} MB)"
 
-            # Update file list
-            self.file_list.controls.clear()
-            for file_path, file_name in self.selected_files[:10]:  # Show first 10 files
-                self.file_list.controls.append(
-                    ft.Container(
-                        content=ft.Row(
-                            controls=[
-                                ft.Icon(self._get_file_icon(file_path), size=16, color=ft.Colors.BLUE_ACCENT_400),
-                                ft.Text(file_name, size=12, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS),
-                            ],
-                            spacing=10,
-                        ),
-                        padding=5,
-                    )
-                )
-
-            if len(self.selected_files) > 10:
-                self.file_list.controls.append(
-                    ft.Text(f"... and {len(self.selected_files) - 10} more files", size=12, italic=True)
-                )
+            # Swap in the first page of rows in one assignment
+            first_page = min(FILE_LIST_PAGE_SIZE, len(self.selected_files))
+            self.file_list.controls[:] = [self._make_file_row(i) for i in range(first_page)]
 
             # Show file list container
-            self.file_list.parent.visible = True
+            self.file_list_wrapper.visible = True
 
             # Enable convert button
             self.convert_button.disabled = False
 
             # Update drop zone appearance
-            self.drop_container.bgcolor = ft.Colors.with_opacity(0.1, ft.Colors.GREEN_ACCENT_400)
-            self.drop_container.border = ft.border.all(2, ft.Colors.with_opacity(0.5, ft.Colors.GREEN_ACCENT_400))
+            self.drop_container.bgcolor = GREEN_BG
+            self.drop_container.border = ft.border.all(2, GREEN_50)
 
         self.on_files_selected(self.selected_files)
         self.update()
 
-    def _get_file_icon(self, file_path):
-        ext = Path(file_path).suffix.lower()
-        icon_map = {
-            '.pdf': ft.Icons.PICTURE_AS_PDF_ROUNDED,
-            '.docx': ft.Icons.ARTICLE_ROUNDED,
-            '.xlsx': ft.Icons.TABLE_CHART_ROUNDED,
-            '.pptx': ft.Icons.SLIDESHOW_ROUNDED,
-            '.html': ft.Icons.HTML_ROUNDED,
-            '.jpg': ft.Icons.IMAGE_ROUNDED,
-            '.jpeg': ft.Icons.IMAGE_ROUNDED,
-            '.png': ft.Icons.IMAGE_ROUNDED,
-            '.txt': ft.Icons.DESCRIPTION_ROUNDED,
-            '.csv': ft.Icons.TABLE_ROWS_ROUNDED,
-            '.json': ft.Icons.DATA_OBJECT_ROUNDED,
-            '.xml': ft.Icons.CODE_ROUNDED,
-        }
-        return icon_map.get(ext, ft.Icons.INSERT_DRIVE_FILE_ROUNDED)
+    def _make_file_row(self, index):
+        file_path, file_name, size, ext = self.selected_files[index]
+        return ft.Container(
+            content=ft.Row(
+                controls=[
+                    ft.Icon(self._get_file_icon(ext), size=16, color=ft.Colors.BLUE_ACCENT_400),
+                    ft.Text(file_name, size=12, max_lines=1, overflow=ft.TextOverflow.ELLIPSIS),
+                ],
+                spacing=10,
+            ),
+            padding=5,
+        )
+
+    def _show_more_files(self):
+        """Append the next page of rows to the file list. Returns True if rows were added."""
+        start = len(self.file_list.controls)
+        end = min(start + FILE_LIST_PAGE_SIZE, len(self.selected_files))
+        self.file_list.controls.extend(self._make_file_row(i) for i in range(start, end))
+        return end > start
+
+    def on_file_list_scroll(self, e: ft.OnScrollEvent):
+        # Load the next page when the user scrolls close to the end of the list
+        if e.pixels >= e.max_scroll_extent - FILE_ROW_HEIGHT * 10:
+            if self._show_more_files():
+                self.file_list.update()
+
+    def _get_file_icon(self, ext):
+        return FILE_ICONS.get(ext, DEFAULT_ICON)
 
     def clear_selection(self, e):
+        self._scan_generation += 1
         self.selected_files = []
+        self._last_selection_sig = None
         self.file_list.controls.clear()
-        self.file_list.parent.visible = False
+        self.file_list_wrapper.visible = False
         self.stats_text.value = "No files selected"
         self.convert_button.disabled = True
 
         # Reset drop zone appearance
-        self.drop_container.bgcolor = ft.Colors.with_opacity(0.05, ft.Colors.BLUE_ACCENT_400)
-        self.drop_container.border = ft.border.all(2, ft.Colors.with_opacity(0.3, ft.Colors.BLUE_ACCENT_400))
+        self.drop_container.bgcolor = BLUE_BG
+        self.drop_container.border = ft.border.all(2, BLUE_30)
 
         self.update()
 
@@ -2,32 +2,53 @@ import flet as ft
 from ui.file_selector import FileSelector
 from ui.progress_view import ProgressView
 from ui.settings_panel import SettingsPanel
-from converter.markitdown_wrapper import MarkItDownConverter
+from converter.settings import ConversionSettings, CONVERSION_SETTING_FIELDS
 import asyncio
+import logging
+
+
+log = logging.getLogger(__name__)
+
+NAV_ACTIVE_BG = ft.Colors.with_opacity(0.1, ft.Colors.BLUE_ACCENT_400)
+NAV_INACTIVE_COLOR = ft.Colors.with_opacity(0.7, ft.Colors.WHITE)
+
+
+def _make_converter():
+    """Import MarkItDown and build the converter; slow, so run it off the event loop."""
+    from converter.markitdown_wrapper import MarkItDownConverter
+    return MarkItDownConverter()
 
 
 class MainWindow(ft.Container):
     def __init__(self, page: ft.Page):
         self.page = page
-        self.converter = MarkItDownConverter()
+        self.converter = None  # Created on first conversion; importing MarkItDown is slow
         self.current_view = "selector"  # selector, progress, settings
 
         # Components
         self.file_selector = None
         self.progress_view = None
         self.settings_panel = None
+        self.nav_buttons = {}  # view name -> (container, icon, label)
 
         # State
         self.selected_files = []
         self.output_directory = ""
-        self.conversion_settings = {
-            "use_llm": False,
-            "overwrite_policy": "skip",
-            "add_timestamp": False,
-            "preserve_structure": True
-        }
+        self.conversion_settings = ConversionSettings()
 
         super().__init__(content=self._build())
+        # Control.__init__ resets self.page until the window is mounted, so use the argument
+        self._register_pickers(page)
+
+    def _register_pickers(self, page):
+        """Add the file selector's pickers to the page overlay, once."""
+        pickers = [
+            self.file_selector.file_picker,
+            self.file_selector.folder_picker,
+            self.file_selector.output_folder_picker,
+        ]
+        overlay = page.overlay
+        overlay.extend(picker for picker in pickers if picker not in overlay)
 
     def _build(self):
         # Initialize components
@@ -35,14 +56,6 @@ class MainWindow(ft.Container):
         self.progress_view = ProgressView()
         self.settings_panel = SettingsPanel(self.on_settings_changed)
 
-        # Add file pickers to page overlay
-        if self.page and hasattr(self.file_selector, 'file_picker'):
-            self.page.overlay.extend([
-                self.file_selector.file_picker,
-                self.file_selector.folder_picker,
-                self.file_selector.output_folder_picker
-            ])
-
         # Create modern glass-morphic container
         self.main_container = ft.Container(
             content=ft.Column(
@@ -151,39 +164,44 @@ class MainWindow(ft.Container):
         )
 
     def _create_nav_button(self, icon, label, view_name):
-        is_active = self.current_view == view_name
-        return ft.Container(
+        icon_control = ft.Icon(icon, size=20)
+        label_control = ft.Text(label, size=14)
+        button = ft.Container(
             content=ft.Row(
-                controls=[
-                    ft.Icon(
-                        icon,
-                        size=20,
-                        color=ft.Colors.BLUE_ACCENT_400 if is_active else ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
-                    ),
-                    ft.Text(
-                        label,
-                        size=14,
-                        color=ft.Colors.WHITE if is_active else ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
-                        weight=ft.FontWeight.BOLD if is_active else ft.FontWeight.NORMAL,
-                    ),
-                ],
+                controls=[icon_control, label_control],
                 spacing=8,
             ),
             padding=ft.padding.symmetric(horizontal=15, vertical=8),
             border_radius=10,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.BLUE_ACCENT_400) if is_active else None,
             on_click=lambda e, v=view_name: self.switch_view(v),
             animate=ft.Animation(200, ft.AnimationCurve.EASE_IN_OUT),
         )
+        # Keep the parts whose look depends on the active view for switch_view
+        self.nav_buttons[view_name] = (button, icon_control, label_control)
+        self._style_nav_button(view_name, self.current_view == view_name)
+        return button
+
+    def _style_nav_button(self, view_name, is_active):
+        """Apply the active or inactive look to a nav button."""
+        button, icon_control, label_control = self.nav_buttons[view_name]
+        icon_control.color = ft.Colors.BLUE_ACCENT_400 if is_active else NAV_INACTIVE_COLOR
+        label_control.color = ft.Colors.WHITE if is_active else NAV_INACTIVE_COLOR
+        label_control.weight = ft.FontWeight.BOLD if is_active else ft.FontWeight.NORMAL
+        button.bgcolor = NAV_ACTIVE_BG if is_active else None
 
     def _create_content_area(self):
-        self.content_container = ft.AnimatedSwitcher(
-            content=self.file_selector,
-            transition=ft.AnimatedSwitcherTransition.FADE,
-            duration=300,
-            reverse_duration=200,
-            switch_in_curve=ft.AnimationCurve.EASE_IN_OUT,
-            switch_out_curve=ft.AnimationCurve.EASE_IN_OUT,
+        # All views stay mounted and only the current one is visible, so
+        # switching does not rebuild a view or drop its state (e.g. progress rows)
+        self.views = {
+            "selector": self.file_selector,
+            "progress": self.progress_view,
+            "settings": self.settings_panel,
+        }
+        for name, view in self.views.items():
+            view.visible = name == self.current_view
+
+        self.content_container = ft.Stack(
+            controls=list(self.views.values()),
             expand=True,
         )
 
@@ -194,17 +212,18 @@ class MainWindow(ft.Container):
         )
 
     def switch_view(self, view_name):
+        previous_view = self.current_view
         self.current_view = view_name
 
-        if view_name == "selector":
-            self.content_container.content = self.file_selector
-        elif view_name == "progress":
-            self.content_container.content = self.progress_view
-        elif view_name == "settings":
-            self.content_container.content = self.settings_panel
+        for name, view in self.views.items():
+            view.visible = name == view_name
+        self.content_container.update()
 
-        # Update navigation buttons
-        self.update()
+        # Restyle only the two nav buttons whose state changed
+        if previous_view != view_name:
+            for name, is_active in ((previous_view, False), (view_name, True)):
+                self._style_nav_button(name, is_active)
+                self.nav_buttons[name][0].update()
 
     def toggle_theme(self, e):
         self.page.theme_mode = (
@@ -217,7 +236,7 @@ class MainWindow(ft.Container):
 
     def on_files_selected(self, files):
         self.selected_files = files
-        print(f"Files selected: {len(files)}")
+        log.debug("Files selected: %d", len(files))
 
     def on_start_conversion(self, files, output_dir):
         self.selected_files = files
@@ -230,6 +249,9 @@ class MainWindow(ft.Container):
         self.page.run_task(self.start_conversion_async)
 
     async def start_conversion_async(self):
+        if self.converter is None:
+            self.converter = await asyncio.to_thread(_make_converter)
+
         await self.converter.batch_convert(
             self.selected_files,
             self.output_directory,
@@ -238,5 +260,8 @@ class MainWindow(ft.Container):
         )
 
     def on_settings_changed(self, settings):
-        self.conversion_settings.update(settings)
-        print(f"Settings updated: {settings}")
\ No newline at end of file
+        # Keys from an older or hand-edited settings file have no field to set
+        for key, value in settings.items():
+            if key in CONVERSION_SETTING_FIELDS:
+                setattr(self.conversion_settings, key, value)
+        log.debug("Settings updated: %s", settings)
\ No newline at end of file
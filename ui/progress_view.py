@@ -4,6 +4,14 @@ from typing import Dict, List
 import os
 
 
+# The conversion log keeps only the most recent rows until "Show all" is used
+LOG_WINDOW = 200
+LOG_ROW_HEIGHT = 45
+
+# Rows dropped from the log window are kept (up to this many) for reuse
+LOG_POOL_SIZE = 50
+
+
 class ProgressView(ft.Container):
     def __init__(self):
         self.current_file = ""
@@ -12,6 +20,14 @@ class ProgressView(ft.Container):
         self.successful = 0
         self.failed = 0
         self.results = []
+        self._log_results = []  # Every result logged so far, for "Show all"
+        self._show_full_log = False
+        self._pending_log = []  # Results waiting for the next log flush
+        self._log_pool = []  # Detached log rows ready to be rebound to new results
+        self._flush_scheduled = False
+        self._last_state = (0, 0, 0, 0)  # (completed, total, successful, failed) on screen
+        self._last_pct = 0  # Percentage the indicators show
+        self._stat_refs: Dict[str, ft.TextSpan] = {}  # "total", "completed", ... -> value span of that card
         super().__init__(content=self._build())
 
     def _build(self):
@@ -58,12 +74,20 @@ class ProgressView(ft.Container):
             spacing=20,
         )
 
-        # Results log
+        # Results log. Rows have a fixed extent so only the visible ones are
+        # laid out; the gap between rows is a margin inside that extent.
+        # _flush_log scrolls to the end itself, once per batch of rows.
         self.results_list = ft.ListView(
             height=300,
-            spacing=5,
+            item_extent=LOG_ROW_HEIGHT,
             padding=ft.padding.all(10),
-            auto_scroll=True,
+            auto_scroll=False,
+        )
+
+        self.show_all_log_btn = ft.TextButton(
+            "Show all",
+            visible=False,
+            on_click=self.show_full_log,
         )
 
         # Action buttons
@@ -143,7 +167,13 @@ class ProgressView(ft.Container):
                 ft.Container(
                     content=ft.Column(
                         controls=[
-                            ft.Text("Conversion Log", size=16, weight=ft.FontWeight.W_500),
+                            ft.Row(
+                                controls=[
+                                    ft.Text("Conversion Log", size=16, weight=ft.FontWeight.W_500),
+                                    self.show_all_log_btn,
+                                ],
+                                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                            ),
                             ft.Container(
                                 content=self.results_list,
                                 border=ft.border.all(1, ft.Colors.with_opacity(0.1, ft.Colors.WHITE)),
@@ -173,23 +203,27 @@ class ProgressView(ft.Container):
         )
 
     def _create_stat_card(self, label: str, value: str, color: str, icon: str):
-        stat_value = ft.Text(
+        # Value and label are two spans of one Text, so a card is only
+        # Container > Column > [Icon, Text] and an update changes one span
+        stat_value = ft.TextSpan(
             value,
-            size=24,
-            weight=ft.FontWeight.BOLD,
-            color=ft.Colors.WHITE,
-            key=f"stat_{label.lower()}",
+            ft.TextStyle(size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
         )
+        self._stat_refs[label.lower()] = stat_value
 
         return ft.Container(
             content=ft.Column(
                 controls=[
                     ft.Icon(icon, size=32, color=color),
-                    stat_value,
                     ft.Text(
-                        label,
-                        size=12,
-                        color=ft.Colors.with_opacity(0.7, ft.Colors.WHITE),
+                        spans=[
+                            stat_value,
+                            ft.TextSpan(
+                                f"\n{label}",
+                                ft.TextStyle(size=12, color=ft.Colors.with_opacity(0.7, ft.Colors.WHITE)),
+                            ),
+                        ],
+                        text_align=ft.TextAlign.CENTER,
                     ),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
@@ -214,26 +248,41 @@ class ProgressView(ft.Container):
         results: List = None,
     ):
         """Update the progress display"""
+        # Only fields that differ from the last call are written; a call that
+        # changes nothing skips the update entirely
+        state = (completed, total, successful, failed)
+        last_completed, last_total, last_successful, last_failed = self._last_state
+        file_changed = bool(current_file) and current_file != self.current_file_text.value
+        if state == self._last_state and not file_changed and last_result is None and status != "complete":
+            return
+        self._last_state = state
+
         self.completed = completed
         self.total = total
         self.successful = successful
         self.failed = failed
 
-        if current_file:
+        if file_changed:
             self.current_file_text.value = current_file
 
-        # Update progress indicators
+        # Update progress indicators in whole-percent steps; smaller moves are not redrawn
         if total > 0:
-            progress = completed / total
-            self.circular_progress.value = progress
-            self.linear_progress.value = progress
-            self.progress_percentage.value = f"{int(progress * 100)}%"
+            pct = completed * 100 // total
+            if pct != self._last_pct:
+                self._last_pct = pct
+                self.circular_progress.value = pct / 100
+                self.linear_progress.value = pct / 100
+                self.progress_percentage.value = f"{pct}%"
 
         # Update statistics
-        self._update_stat_card("stat_total", str(total))
-        self._update_stat_card("stat_completed", str(completed))
-        self._update_stat_card("stat_successful", str(successful))
-        self._update_stat_card("stat_failed", str(failed))
+        if total != last_total:
+            self._update_stat_card("total", str(total))
+        if completed != last_completed:
+            self._update_stat_card("completed", str(completed))
+        if successful != last_successful:
+            self._update_stat_card("successful", str(successful))
+        if failed != last_failed:
+            self._update_stat_card("failed", str(failed))
 
         # Add result to log
         if last_result:
@@ -255,24 +304,64 @@ class ProgressView(ft.Container):
         self.update()
 
     def _update_stat_card(self, key: str, value: str):
-        """Update a specific stat card value"""
-        for row in self.stats_row.controls:
-            for control in row.content.controls:
-                if isinstance(control, ft.Text) and hasattr(control, 'key') and control.key == key:
-                    control.value = value
-                    # Add pulse animation
-                    row.scale = 1.1
-                    row.update()
-                    row.scale = 1.0
-                    row.update()
-                    break
+        """Update a specific stat card value (sent with the caller's next update)"""
+        stat_value = self._stat_refs.get(key)
+        if stat_value is not None:  # Unknown keys are ignored, as the old control scan did
+            stat_value.text = value
 
     def _add_result_to_log(self, result: Dict):
-        """Add a conversion result to the log"""
+        """Queue a conversion result for the log; results arriving in the same tick share one update"""
+        self._pending_log.append(result)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_log)
+
+    def _flush_log(self):
+        """Add all queued results to the log with a single update"""
+        pending = self._pending_log
+        self._pending_log = []
+        self._flush_scheduled = False
+
+        self._log_results.extend(pending)
+        controls = self.results_list.controls
+
+        # Drop the oldest rows once the window is full; "Show all" brings them back.
+        # Dropped rows go to the pool first so the new entries can reuse them.
+        if not self._show_full_log:
+            overflow = len(controls) + len(pending) - LOG_WINDOW
+            if overflow > 0:
+                evicted = min(overflow, len(controls))
+                room = LOG_POOL_SIZE - len(self._log_pool)
+                self._log_pool.extend(controls[:min(evicted, room)])
+                del controls[:evicted]
+                pending = pending[overflow - evicted:]
+                self.show_all_log_btn.visible = True
+                self.show_all_log_btn.update()
+
+        controls.extend(self._create_log_entry(result) for result in pending)
+
+        # Scroll to the newest row once per flush; scroll_to sends the new rows
+        # in the same update
+        self.results_list.scroll_to(offset=-1, duration=0)
+
+    def _create_log_entry(self, result: Dict):
+        """Build the log row for a conversion result, reusing a pooled row if there is one"""
         icon = ft.Icons.CHECK_CIRCLE_ROUNDED if result["success"] else ft.Icons.ERROR_ROUNDED
         color = ft.Colors.GREEN_ACCENT_400 if result["success"] else ft.Colors.RED_ACCENT_400
+        status = "✓" if result["success"] else f"✗ {result.get('error', 'Failed')}"
+
+        if self._log_pool:
+            log_entry = self._log_pool.pop()
+            icon_control, file_text, status_text = log_entry.content.controls
+            icon_control.name = icon
+            icon_control.color = color
+            file_text.value = result["file"]
+            status_text.value = status
+            status_text.color = color
+            log_entry.bgcolor = ft.Colors.with_opacity(0.05, color)
+            return log_entry
 
-        log_entry = ft.Container(
+        return ft.Container(
             content=ft.Row(
                 controls=[
                     ft.Icon(icon, size=20, color=color),
@@ -284,7 +373,7 @@ class ProgressView(ft.Container):
                         overflow=ft.TextOverflow.ELLIPSIS,
                     ),
                     ft.Text(
-                        "✓" if result["success"] else f"✗ {result.get('error', 'Failed')}",
+                        status,
                         size=12,
                         color=color,
                     ),
@@ -292,17 +381,17 @@ class ProgressView(ft.Container):
                 spacing=10,
             ),
             padding=10,
+            margin=ft.margin.only(bottom=5),
             border_radius=8,
             bgcolor=ft.Colors.with_opacity(0.05, color),
-            animate_opacity=300,
-            opacity=0,
         )
 
-        self.results_list.controls.append(log_entry)
-
-        # Animate entry appearance
-        log_entry.opacity = 1
-        self.results_list.update()
+    def show_full_log(self, e):
+        """Show every logged result instead of only the most recent ones"""
+        self._show_full_log = True
+        self.results_list.controls[:] = [self._create_log_entry(result) for result in self._log_results]
+        self.show_all_log_btn.visible = False
+        self.update()
 
     def cancel_conversion(self, e):
         """Cancel the current conversion process"""
@@ -328,15 +417,22 @@ class ProgressView(ft.Container):
         self.linear_progress.value = 0
         self.linear_progress.color = ft.Colors.BLUE_ACCENT_400
         self.progress_percentage.value = "0%"
+        self._last_pct = 0
         self.current_file_text.value = "Waiting to start..."
 
+        self._log_results = []
+        self._pending_log.clear()  # A flush already scheduled then adds nothing
+        self._show_full_log = False
+        room = LOG_POOL_SIZE - len(self._log_pool)
+        self._log_pool.extend(self.results_list.controls[:room])
         self.results_list.controls.clear()
+        self.show_all_log_btn.visible = False
         self.open_folder_btn.visible = False
         self.cancel_btn.visible = True
 
-        self._update_stat_card("stat_total", "0")
-        self._update_stat_card("stat_completed", "0")
-        self._update_stat_card("stat_successful", "0")
-        self._update_stat_card("stat_failed", "0")
+        # The controls built in _build are reused; only their values change
+        self._last_state = (0, 0, 0, 0)
+        for stat_value in self._stat_refs.values():
+            stat_value.text = "0"
 
         self.update()
\ No newline at end of file
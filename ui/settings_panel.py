@@ -1,13 +1,51 @@
 import flet as ft
+import asyncio
+import functools
 import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib json module gives the same output
+    orjson = None
+
+
+def _settings_to_json(settings):
+    """Serialize settings as indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(settings, indent=2)
+
+
+def _settings_from_json(text):
+    """Parse settings JSON text."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# (category, formats) pairs listed in the supported formats section
+_FORMATS = (
+    ("Documents", ("PDF", "Word (.docx)", "PowerPoint (.pptx)", "Excel (.xlsx)", "EPub")),
+    ("Images", ("JPEG", "PNG", "GIF", "BMP (with OCR support)")),
+    ("Web", ("HTML", "YouTube URLs")),
+    ("Text", ("TXT", "CSV", "JSON", "XML")),
+    ("Audio", ("MP3", "WAV", "M4A (with transcription)")),
+    ("Archives", ("ZIP (processes contents)",)),
+)
+
+# Seconds without further control changes before settings are reported
+SETTING_CHANGE_DELAY = 0.1
+
 
 class SettingsPanel(ft.Container):
+    # Resolved once at import instead of per load/save
+    _SETTINGS_PATH = Path.home() / ".markitdown_converter" / "settings.json"
+
     def __init__(self, on_settings_changed):
         self.on_settings_changed = on_settings_changed
-        self.settings_file = Path.home() / ".markitdown_converter" / "settings.json"
+        self._change_handle = None  # Pending _emit_settings call while controls are still changing
         self.settings = self.load_settings()
         super().__init__(content=self._build())
 
@@ -30,13 +68,6 @@ class SettingsPanel(ft.Container):
             on_change=self.on_setting_change,
         )
 
-        self.preserve_structure = ft.Switch(
-            label="Preserve document structure",
-            value=self.settings.get("preserve_structure", True),
-            active_color=ft.Colors.BLUE_ACCENT_400,
-            on_change=self.on_setting_change,
-        )
-
         self.use_llm = ft.Switch(
             label="Use AI for enhanced image descriptions (requires API key)",
             value=self.settings.get("use_llm", False),
@@ -236,19 +267,11 @@ class SettingsPanel(ft.Container):
             border=ft.border.all(1, ft.Colors.with_opacity(0.1, color)),
         )
 
-    def _create_info_section(self):
-        """Create the supported formats information section"""
-        formats = {
-            "Documents": ["PDF", "Word (.docx)", "PowerPoint (.pptx)", "Excel (.xlsx)", "EPub"],
-            "Images": ["JPEG", "PNG", "GIF", "BMP (with OCR support)"],
-            "Web": ["HTML", "YouTube URLs"],
-            "Text": ["TXT", "CSV", "JSON", "XML"],
-            "Audio": ["MP3", "WAV", "M4A (with transcription)"],
-            "Archives": ["ZIP (processes contents)"],
-        }
-
+    @functools.cached_property
+    def format_chips(self):
+        """Chips for the supported formats section, built once per panel"""
         format_chips = []
-        for category, items in formats.items():
+        for category, items in _FORMATS:
             format_chips.append(
                 ft.Container(
                     content=ft.Text(category, size=12, weight=ft.FontWeight.BOLD),
@@ -266,7 +289,10 @@ class SettingsPanel(ft.Container):
                         bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.BLUE_ACCENT_400),
                     )
                 )
+        return format_chips
 
+    def _create_info_section(self):
+        """Create the supported formats information section"""
         return ft.Container(
             content=ft.Column(
                 controls=[
@@ -279,7 +305,7 @@ class SettingsPanel(ft.Container):
                     ),
                     ft.Container(
                         content=ft.Row(
-                            controls=format_chips,
+                            controls=self.format_chips,
                             wrap=True,
                             spacing=8,
                             run_spacing=8,
@@ -295,8 +321,20 @@ class SettingsPanel(ft.Container):
             border=ft.border.all(1, ft.Colors.with_opacity(0.1, ft.Colors.PURPLE_ACCENT_400)),
         )
 
-    def on_setting_change(self, e):
+    async def on_setting_change(self, e):
         """Handle setting changes"""
+        # A slider drag fires on every tick; report once it has been quiet for 100 ms.
+        # Async so the handler runs on the event loop that call_later schedules on.
+        if self._change_handle is not None:
+            self._change_handle.cancel()
+        self._change_handle = asyncio.get_running_loop().call_later(
+            SETTING_CHANGE_DELAY, self._emit_settings
+        )
+
+    def _emit_settings(self):
+        """Copy the control values into the settings and notify the parent."""
+        self._change_handle = None
+
         # Update settings dictionary
         self.settings["overwrite_policy"] = self.overwrite_policy.value
         self.settings["add_timestamp"] = self.add_timestamp.value
@@ -308,12 +346,17 @@ class SettingsPanel(ft.Container):
         # Notify parent
         self.on_settings_changed(self.settings)
 
-    def save_settings_to_file(self, e):
+    async def save_settings_to_file(self, e):
         """Save settings to JSON file"""
+        # Apply a control change still waiting out its debounce so it is saved too
+        if self._change_handle is not None:
+            self._change_handle.cancel()
+            self._emit_settings()
+
         try:
-            os.makedirs(self.settings_file.parent, exist_ok=True)
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # The write runs on a worker thread so a slow disk does not stall the UI
+            text = _settings_to_json(self.settings)
+            await asyncio.get_running_loop().run_in_executor(None, self._write_settings_sync, text)
 
             # Show success message
             if self.page:
@@ -333,6 +376,13 @@ class SettingsPanel(ft.Container):
                     )
                 )
 
+    def _write_settings_sync(self, text):
+        """Write serialized settings to the settings file, creating its folder if needed."""
+        if not self._SETTINGS_PATH.parent.exists():
+            os.makedirs(self._SETTINGS_PATH.parent, exist_ok=True)
+        with open(self._SETTINGS_PATH, 'w') as f:
+            f.write(text)
+
     def load_settings(self):
         """Load settings from JSON file"""
         default_settings = {
@@ -344,18 +394,23 @@ class SettingsPanel(ft.Container):
             "enhancement_level": "standard",
         }
 
-        if self.settings_file.exists():
+        if self._SETTINGS_PATH.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    loaded_settings = json.load(f)
+                with open(self._SETTINGS_PATH, 'r') as f:
+                    loaded_settings = _settings_from_json(f.read())
                     default_settings.update(loaded_settings)
             except Exception as ex:
                 print(f"Error loading settings: {ex}")
 
         return default_settings
 
-    def reset_settings(self, e):
+    async def reset_settings(self, e):
         """Reset settings to defaults"""
+        # Async like on_setting_change, so the pending handle is cancelled on its own loop
+        if self._change_handle is not None:
+            self._change_handle.cancel()
+            self._change_handle = None
+
         self.settings = {
             "overwrite_policy": "skip",
             "add_timestamp": False,